@@ -12,6 +12,7 @@ On first run, creates a venv using uv and installs dependencies.
 """
 
 import os
+import stat
 import sys
 import subprocess
 import shutil
@@ -21,23 +22,42 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent.resolve()
 VENV_DIR = SCRIPT_DIR / ".venv"
 REQUIREMENTS_FILE = SCRIPT_DIR / "requirements.txt"
+UV_PATH_CACHE = VENV_DIR / ".uv_path"
 
 
 def ensure_uv() -> str:
     """Ensure uv is available, return path to uv executable."""
+    # A path cached by a previous launch is one read + one access check,
+    # versus shutil.which stat'ing every directory on PATH.
+    try:
+        cached = UV_PATH_CACHE.read_text().strip()
+        if cached and os.access(cached, os.X_OK):
+            return cached
+    except OSError:
+        pass
+
     uv_path = shutil.which("uv")
+
+    if not uv_path:
+        # Try common locations
+        for path in [
+            Path.home() / ".local" / "bin" / "uv",
+            Path.home() / ".cargo" / "bin" / "uv",
+            Path("/usr/local/bin/uv"),
+        ]:
+            if path.exists():
+                uv_path = str(path)
+                break
+
     if uv_path:
+        # Best effort: the cache dir is the venv, which may not exist yet on
+        # the very first run.
+        try:
+            UV_PATH_CACHE.write_text(uv_path)
+        except OSError:
+            pass
         return uv_path
 
-    # Try common locations
-    for path in [
-        Path.home() / ".local" / "bin" / "uv",
-        Path.home() / ".cargo" / "bin" / "uv",
-        Path("/usr/local/bin/uv"),
-    ]:
-        if path.exists():
-            return str(path)
-
     print("Error: uv not found. Please install uv first:")
     print("  curl -LsSf https://astral.sh/uv/install.sh | sh")
     sys.exit(1)
@@ -51,18 +71,32 @@ def ensure_venv(uv: str) -> Path:
         print("Creating virtual environment with uv...")
         subprocess.run([uv, "venv", str(VENV_DIR)], check=True, cwd=SCRIPT_DIR)
 
-    # Check if we need to install/update dependencies
+    # Trust the marker file on the happy path; comparing mtimes costs two
+    # extra stats per launch and only matters after requirements.txt changes,
+    # so it is opt-in via --check-deps or SUPERPOWERS_CHECK_DEPS.
     marker_file = VENV_DIR / ".requirements_installed"
-    requirements_mtime = REQUIREMENTS_FILE.stat().st_mtime if REQUIREMENTS_FILE.exists() else 0
-    marker_mtime = marker_file.stat().st_mtime if marker_file.exists() else 0
+    try:
+        marker_mtime = os.stat(marker_file).st_mtime
+    except FileNotFoundError:
+        needs_install = True
+    else:
+        needs_install = False
+        if "--check-deps" in sys.argv[1:] or os.environ.get("SUPERPOWERS_CHECK_DEPS"):
+            try:
+                needs_install = os.stat(REQUIREMENTS_FILE).st_mtime > marker_mtime
+            except FileNotFoundError:
+                pass
 
-    if requirements_mtime > marker_mtime:
+    if needs_install:
         print("Installing dependencies with uv...")
+        # Setting VIRTUAL_ENV in our own environment lets the child inherit
+        # it without copying the full environ into a throwaway dict; we're
+        # about to re-exec into the venv python anyway.
+        os.environ["VIRTUAL_ENV"] = str(VENV_DIR)
         subprocess.run(
             [uv, "pip", "install", "-r", str(REQUIREMENTS_FILE)],
             check=True,
             cwd=SCRIPT_DIR,
-            env={**os.environ, "VIRTUAL_ENV": str(VENV_DIR)},
         )
         marker_file.touch()
 
@@ -71,13 +105,13 @@ def ensure_venv(uv: str) -> Path:
 
 def main_bootstrap():
     """Bootstrap: ensure venv and re-exec with venv python if needed."""
-    # If we're already in the venv, run the app
-    if sys.prefix != sys.base_prefix:
+    # Fast path: the env var set before re-exec proves we're in the venv
+    # without any stat or readlink chain.
+    if os.environ.get("SUPERPOWERS_IN_VENV"):
         return run_app()
 
-    # Check if running from the venv python
-    venv_python = VENV_DIR / "bin" / "python"
-    if Path(sys.executable).resolve() == venv_python.resolve():
+    # If we're already in the venv, run the app
+    if sys.prefix != sys.base_prefix:
         return run_app()
 
     # Bootstrap: ensure venv and re-exec
@@ -85,6 +119,7 @@ def main_bootstrap():
     venv_python = ensure_venv(uv)
 
     # Re-exec with venv python
+    os.environ["SUPERPOWERS_IN_VENV"] = "1"
     os.execv(str(venv_python), [str(venv_python), __file__] + sys.argv[1:])
 
 
@@ -92,6 +127,7 @@ def main_bootstrap():
 # Main Application (runs inside venv)
 # =============================================================================
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
@@ -103,7 +139,19 @@ class ItemStatus(Enum):
     CONFLICT = "conflict"  # Exists but wrong symlink or not a symlink
 
 
-@dataclass
+# (status, error template) per observable destination state, indexed by the
+# key computed in check_status: 0 = missing, 1 = correct symlink,
+# 2 = symlink to the wrong place, 3 = existing non-symlink. Error strings
+# only format for the two conflict cases.
+_STATUS_TABLE = (
+    (ItemStatus.NOT_INSTALLED, None),
+    (ItemStatus.INSTALLED, None),
+    (ItemStatus.CONFLICT, "Symlink points to {target}, expected {expected}"),
+    (ItemStatus.CONFLICT, "Path exists but is not a symlink: {dest}"),
+)
+
+
+@dataclass(slots=True)
 class Item:
     name: str
     category: str  # "commands", "skills", "agents"
@@ -112,110 +160,222 @@ class Item:
     status: ItemStatus = ItemStatus.NOT_INSTALLED
     selected: bool = False
     error_message: Optional[str] = None
+    # Render-ready form of error_message, truncated once when the error is
+    # recorded rather than on every redraw.
+    display_error: str = ""
+    # Source paths live under SCRIPT_DIR (already resolved) and never move
+    # between refreshes, so discover_items caches the resolved form here.
+    _resolved_source: Optional[Path] = None
+    # Back-reference to this item's tree node, set when the tree is built,
+    # so label updates can patch exactly one node.
+    _tree_node: Optional[object] = None
+    # String form of dest_path, converted once so syscall sites skip the
+    # per-call __fspath__ dance.
+    dest_str: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.dest_str = os.fspath(self.dest_path)
+
+    def _set_error(self, message: Optional[str]) -> None:
+        """Record an error and its precomputed display form."""
+        self.error_message = message
+        if message is None:
+            self.display_error = ""
+        elif len(message) > 40:
+            self.display_error = f" ({message[:40]}...)"
+        else:
+            self.display_error = f" ({message})"
 
     def check_status(self) -> None:
         """Check the current installation status of this item."""
-        if not self.dest_path.exists() and not self.dest_path.is_symlink():
-            self.status = ItemStatus.NOT_INSTALLED
-            self.error_message = None
-        elif self.dest_path.is_symlink():
-            try:
-                target = self.dest_path.resolve()
-                expected = self.source_path.resolve()
-                if target == expected:
-                    self.status = ItemStatus.INSTALLED
-                    self.error_message = None
-                else:
-                    self.status = ItemStatus.CONFLICT
-                    self.error_message = f"Symlink points to {target}, expected {expected}"
-            except Exception as e:
-                self.status = ItemStatus.CONFLICT
-                self.error_message = str(e)
-        else:
+        # A single lstat answers both "exists?" and "is it a symlink?"
+        # without re-traversing the path per question. Any OSError — missing,
+        # a non-directory parent, no permission — means the item isn't
+        # installed at dest_path, matching the old exists() -> False answer.
+        try:
+            st = os.lstat(self.dest_str)
+        except OSError:
+            self._apply_state(0, None)
+            return
+
+        self._classify_existing(stat.S_ISLNK(st.st_mode))
+
+    def _classify_existing(self, is_symlink: bool) -> None:
+        """Classify a destination that is known to exist."""
+        if not is_symlink:
+            self._apply_state(3, None)
+            return
+        try:
+            expected = self._resolved_source or self.source_path.resolve()
+            # Fast path: compare the raw link target before falling back to
+            # an inode comparison.
+            target = os.readlink(self.dest_str)
+            correct = target == str(expected) or _same_file(
+                self.dest_str, str(expected)
+            )
+            self._apply_state(1 if correct else 2, target)
+        except Exception as e:
             self.status = ItemStatus.CONFLICT
-            self.error_message = f"Path exists but is not a symlink: {self.dest_path}"
+            self._set_error(str(e))
+
+    def _apply_state(self, key: int, target: Optional[str]) -> None:
+        """Set status and error from the _STATUS_TABLE entry for this key.
+
+        The common missing/installed cases are a tuple lookup with no string
+        work; error formatting only runs for the conflict keys.
+        """
+        self.status, template = _STATUS_TABLE[key]
+        if template is None:
+            self._set_error(None)
+        else:
+            self._set_error(
+                template.format(
+                    target=target,
+                    expected=self._resolved_source or self.source_path,
+                    dest=self.dest_path,
+                )
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     name: str
     items: list[Item] = field(default_factory=list)
+    _tree_node: Optional[object] = None
+    # Maintained counters: incremented/decremented wherever an item's
+    # selection or status changes, so the all_* checks are O(1) per redraw
+    # instead of a scan over every item.
+    selected_count: int = 0
+    installed_count: int = 0
 
     @property
     def all_installed(self) -> bool:
-        return all(item.status == ItemStatus.INSTALLED for item in self.items)
+        return self.installed_count == len(self.items)
 
     @property
     def all_selected(self) -> bool:
-        return all(item.selected for item in self.items)
+        return self.selected_count == len(self.items)
+
+
+def _same_file(a: str, b: str) -> bool:
+    """True when both paths land on the same inode. One stat per side
+    instead of a component-by-component resolve() walk of each path."""
+    try:
+        st_a = os.stat(a)
+        st_b = os.stat(b)
+    except OSError:
+        return False
+    return (st_a.st_dev, st_a.st_ino) == (st_b.st_dev, st_b.st_ino)
+
+
+def _scan_dest_links(dest_dir: Path) -> dict[str, bool]:
+    """Map destination entry names to whether each is a symlink.
+
+    One scandir replaces a per-item lstat: absent names are classified with
+    no syscall at all, and is_symlink comes from the directory entry.
+
+    Any OSError — missing, a stray file where the directory should be, no
+    permission — yields an empty map so every item reads as not installed,
+    matching the old exists() -> False behavior.
+    """
+    try:
+        return {entry.name: entry.is_symlink() for entry in os.scandir(dest_dir)}
+    except OSError:
+        return {}
+
+
+def _is_md_file(entry: os.DirEntry) -> bool:
+    """Commands and agents: .md files directly in the category directory."""
+    return entry.is_file(follow_symlinks=False) and entry.name.endswith(".md")
+
+
+def _is_skill_dir(entry: os.DirEntry) -> bool:
+    """Skills: directories containing SKILL.md. is_dir() comes straight from
+    the DirEntry, and a shallow scandir spots SKILL.md from the directory
+    read itself rather than paying a separate stat per skill."""
+    if not entry.is_dir(follow_symlinks=False):
+        return False
+    try:
+        with os.scandir(entry.path) as children:
+            return any(
+                child.name == "SKILL.md" and child.is_file() for child in children
+            )
+    except OSError:
+        return False
+
+
+# (category name, source-entry filter, entry name -> item name)
+_CATEGORY_SPECS = [
+    ("commands", _is_md_file, lambda filename: filename[:-3]),
+    ("skills", _is_skill_dir, lambda dirname: dirname),
+    ("agents", _is_md_file, lambda filename: filename[:-3]),
+]
+
+
+def _scan_category(
+    source_dir: Path,
+    claude_dir: Path,
+    name: str,
+    filter_fn,
+    name_fn,
+) -> Optional[Category]:
+    """Scan one category: one scandir of the source directory, one of the
+    destination. Returns None when the category is absent or empty."""
+    src = source_dir / name
+    dest = claude_dir / name
+
+    try:
+        entry_names = sorted(
+            entry.name for entry in os.scandir(src) if filter_fn(entry)
+        )
+    except FileNotFoundError:
+        return None
+    if not entry_names:
+        return None
+
+    dest_links = _scan_dest_links(dest)
+    items = []
+    for entry_name in entry_names:
+        item = Item(
+            name=name_fn(entry_name),
+            category=name,
+            source_path=src / entry_name,
+            dest_path=dest / entry_name,
+        )
+        item._resolved_source = item.source_path
+        is_link = dest_links.get(entry_name)
+        if is_link is None:
+            item.status = ItemStatus.NOT_INSTALLED
+        else:
+            item._classify_existing(is_link)
+        item.selected = item.status == ItemStatus.INSTALLED
+        items.append(item)
 
+    category = Category(name=name, items=items)
+    category.installed_count = sum(
+        1 for item in items if item.status == ItemStatus.INSTALLED
+    )
+    # Selection starts out mirroring installed state.
+    category.selected_count = category.installed_count
+    return category
 
-def discover_items(source_dir: Path, claude_dir: Path) -> list[Category]:
-    """Discover all installable items from the source directory."""
-    categories = []
-
-    # Commands: .md files directly in commands/
-    commands_src = source_dir / "commands"
-    commands_dest = claude_dir / "commands"
-    if commands_src.exists():
-        items = []
-        for f in sorted(commands_src.glob("*.md")):
-            name = f.stem
-            item = Item(
-                name=name,
-                category="commands",
-                source_path=f,
-                dest_path=commands_dest / f.name,
-            )
-            item.check_status()
-            item.selected = item.status == ItemStatus.INSTALLED
-            items.append(item)
-        if items:
-            categories.append(Category(name="commands", items=items))
-
-    # Skills: directories containing SKILL.md
-    skills_src = source_dir / "skills"
-    skills_dest = claude_dir / "skills"
-    if skills_src.exists():
-        items = []
-        for d in sorted(skills_src.iterdir()):
-            if d.is_dir() and (d / "SKILL.md").exists():
-                name = d.name
-                item = Item(
-                    name=name,
-                    category="skills",
-                    source_path=d,
-                    dest_path=skills_dest / name,
-                )
-                item.check_status()
-                item.selected = item.status == ItemStatus.INSTALLED
-                items.append(item)
-        if items:
-            categories.append(Category(name="skills", items=items))
-
-    # Agents: .md files directly in agents/
-    agents_src = source_dir / "agents"
-    agents_dest = claude_dir / "agents"
-    if agents_src.exists():
-        items = []
-        for f in sorted(agents_src.glob("*.md")):
-            name = f.stem
-            item = Item(
-                name=name,
-                category="agents",
-                source_path=f,
-                dest_path=agents_dest / f.name,
-            )
-            item.check_status()
-            item.selected = item.status == ItemStatus.INSTALLED
-            items.append(item)
-        if items:
-            categories.append(Category(name="agents", items=items))
 
-    return categories
+def discover_items(source_dir: Path, claude_dir: Path) -> list[Category]:
+    """Discover all installable items from the source directory.
+
+    The category scans are independent IO-bound work, so they run on a small
+    thread pool and overlap; results are assembled in spec order.
+    """
+    with ThreadPoolExecutor(max_workers=len(_CATEGORY_SPECS)) as pool:
+        futures = [
+            pool.submit(_scan_category, source_dir, claude_dir, name, filter_fn, name_fn)
+            for name, filter_fn, name_fn in _CATEGORY_SPECS
+        ]
+        categories = [future.result() for future in futures]
+    return [category for category in categories if category is not None]
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     item: Item
     action: str  # "install" or "uninstall"
@@ -229,7 +389,7 @@ def run_app():
     from textual.widgets import Header, Footer, Tree, Button, Static
     from textual.containers import Container, Horizontal
     from textual.binding import Binding
-    from textual import on
+    from textual import on, work
     from rich.text import Text
 
     class SuperpowersInstaller(App):
@@ -295,9 +455,17 @@ def run_app():
             super().__init__()
             self.source_dir = source_dir
             self.claude_dir = claude_dir
+            self.dest_dirs = {name: claude_dir / name for name, _, _ in _CATEGORY_SPECS}
             self.categories: list[Category] = []
+            self.categories_by_name: dict[str, Category] = {}
             self.results: list[OperationResult] = []
             self.showing_results = False
+            self._results_tree = None
+            self._success_node = None
+            self._failure_node = None
+            self._success_count = 0
+            self._failure_count = 0
+            self._applying = False
 
         def compose(self) -> ComposeResult:
             yield Header()
@@ -315,12 +483,17 @@ def run_app():
             yield Footer()
 
         def on_mount(self) -> None:
-            self.refresh_tree()
+            self.rescan_disk()
+            self.rebuild_tree_widget()
 
-        def refresh_tree(self) -> None:
-            """Refresh the tree view with current state."""
+        def rescan_disk(self) -> None:
+            """Re-discover items from disk. Only needed on mount and explicit
+            Refresh; apply cycles mutate item state in place instead."""
             self.categories = discover_items(self.source_dir, self.claude_dir)
+            self.categories_by_name = {c.name: c for c in self.categories}
 
+        def rebuild_tree_widget(self) -> None:
+            """Rebuild the tree widget from the current categories (pure UI)."""
             tree_container = self.query_one("#tree-container")
             tree_container.remove_children()
 
@@ -331,10 +504,11 @@ def run_app():
                 cat_label = self._make_category_label(category)
                 cat_node = tree.root.add(cat_label, data={"type": "category", "category": category})
                 cat_node.expand()
+                category._tree_node = cat_node
 
                 for item in category.items:
                     item_label = self._make_item_label(item)
-                    cat_node.add_leaf(item_label, data={"type": "item", "item": item})
+                    item._tree_node = cat_node.add_leaf(item_label, data={"type": "item", "item": item})
 
             tree_container.mount(tree)
 
@@ -343,45 +517,36 @@ def run_app():
             checkbox = "[x]" if category.all_selected else "[ ]"
             return Text(f"{checkbox} {category.name}")
 
+        # Styled status fragments are identical for every item, so build them
+        # once and let Text.assemble copy the pre-parsed spans per label.
+        _STATUS_FRAGMENTS = {
+            ItemStatus.INSTALLED: Text("✓ ", style="green"),
+            ItemStatus.CONFLICT: Text("⚠ ", style="yellow"),
+            ItemStatus.NOT_INSTALLED: Text("  "),
+        }
+
         def _make_item_label(self, item: Item) -> Text:
             """Create a label for an item node."""
-            checkbox = "[x]" if item.selected else "[ ]"
-
-            if item.status == ItemStatus.INSTALLED:
-                status_icon = "✓"
-                style = "green"
-            elif item.status == ItemStatus.CONFLICT:
-                status_icon = "⚠"
-                style = "yellow"
-            else:
-                status_icon = " "
-                style = "white"
+            parts = [
+                "[x] " if item.selected else "[ ] ",
+                self._STATUS_FRAGMENTS[item.status],
+                item.name,
+            ]
 
-            text = Text()
-            text.append(f"{checkbox} ")
-            text.append(f"{status_icon} ", style=style)
-            text.append(item.name)
+            if item.display_error:
+                parts.append((item.display_error, "dim"))
 
-            if item.status == ItemStatus.CONFLICT and item.error_message:
-                text.append(f" ({item.error_message[:40]}...)" if len(item.error_message) > 40 else f" ({item.error_message})", style="dim")
+            return Text.assemble(*parts)
 
-            return text
+        def _refresh_item_label(self, item: Item) -> None:
+            """Patch a single item's tree label via its back-reference."""
+            if item._tree_node is not None:
+                item._tree_node.set_label(self._make_item_label(item))
 
-        def _update_tree_display(self) -> None:
-            """Update the tree display after selection changes."""
-            try:
-                tree = self.query_one(Tree)
-                for cat_node in tree.root.children:
-                    if cat_node.data and cat_node.data.get("type") == "category":
-                        category = cat_node.data["category"]
-                        cat_node.set_label(self._make_category_label(category))
-
-                        for item_node in cat_node.children:
-                            if item_node.data and item_node.data.get("type") == "item":
-                                item = item_node.data["item"]
-                                item_node.set_label(self._make_item_label(item))
-            except Exception:
-                pass
+        def _refresh_category_label(self, category: Category) -> None:
+            """Patch a single category's tree label via its back-reference."""
+            if category._tree_node is not None:
+                category._tree_node.set_label(self._make_category_label(category))
 
         @on(Tree.NodeSelected)
         def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
@@ -399,11 +564,19 @@ def run_app():
                 new_state = not category.all_selected
                 for item in category.items:
                     item.selected = new_state
+                    self._refresh_item_label(item)
+                category.selected_count = len(category.items) if new_state else 0
+                self._refresh_category_label(category)
             elif node.data.get("type") == "item":
                 item = node.data["item"]
                 item.selected = not item.selected
-
-            self._update_tree_display()
+                node.set_label(self._make_item_label(item))
+                # The category checkbox may flip when a single item toggles.
+                parent = node.parent
+                if parent and parent.data and parent.data.get("type") == "category":
+                    category = parent.data["category"]
+                    category.selected_count += 1 if item.selected else -1
+                    self._refresh_category_label(category)
 
         def action_toggle_selection(self) -> None:
             """Toggle selection with space key."""
@@ -420,8 +593,9 @@ def run_app():
 
         @on(Button.Pressed, "#refresh-btn")
         def on_refresh_pressed(self) -> None:
-            self.refresh_tree()
-            self.show_results([])
+            self.rescan_disk()
+            self.rebuild_tree_widget()
+            self._clear_results()
 
         @on(Button.Pressed, "#quit-btn")
         def on_quit_pressed(self) -> None:
@@ -431,55 +605,124 @@ def run_app():
             self.apply_changes()
 
         def apply_changes(self) -> None:
-            """Apply the selected changes."""
+            """Kick off the selected changes on a worker thread. Results
+            stream into the results tree as each operation completes instead
+            of appearing all at once at the end."""
+            # One apply at a time: a second run would reset the results tree
+            # while the first worker is still posting into it and re-run the
+            # same operations. The flag also covers the Enter binding, which
+            # a disabled button alone would not.
+            if self._applying:
+                return
+            self._applying = True
+            self.query_one("#apply-btn", Button).disabled = True
+
+            results_container = self.query_one("#results-container")
+            results_container.remove_children()
+            tree = Tree("Results")
+            tree.root.expand()
+            results_container.mount(tree)
+            self._results_tree = tree
+            self._success_node = None
+            self._failure_node = None
+            self._success_count = 0
+            self._failure_count = 0
+            self._apply_worker()
+
+        @work(thread=True, exclusive=True)
+        def _apply_worker(self) -> None:
+            """Run the install/uninstall syscalls off the UI thread, posting
+            each result back as soon as it is known."""
             results: list[OperationResult] = []
 
             for category in self.categories:
-                # Ensure destination directory exists
-                if category.name == "commands":
-                    dest_dir = self.claude_dir / "commands"
-                elif category.name == "skills":
-                    dest_dir = self.claude_dir / "skills"
-                elif category.name == "agents":
-                    dest_dir = self.claude_dir / "agents"
-                else:
+                dest_dir = self.dest_dirs.get(category.name)
+                if dest_dir is None:
                     continue
 
                 for item in category.items:
                     if item.selected and item.status != ItemStatus.INSTALLED:
                         # Install
                         result = self._install_item(item, dest_dir)
-                        results.append(result)
                     elif not item.selected and item.status == ItemStatus.INSTALLED:
                         # Uninstall
                         result = self._uninstall_item(item)
-                        results.append(result)
-                    elif item.selected and item.status == ItemStatus.CONFLICT:
-                        # Conflict - cannot install
-                        results.append(OperationResult(
-                            item=item,
-                            action="install",
-                            success=False,
-                            message=f"Cannot install: {item.error_message}",
-                        ))
                     elif not item.selected and item.status == ItemStatus.CONFLICT:
                         # Conflict - cannot uninstall
-                        results.append(OperationResult(
+                        result = OperationResult(
                             item=item,
                             action="uninstall",
                             success=False,
                             message=f"Cannot uninstall: {item.error_message}",
-                        ))
+                        )
+                    else:
+                        continue
+                    results.append(result)
+                    self.call_from_thread(self._append_result, result)
+
+            self.call_from_thread(self._finish_apply, results)
+
+        def _append_result(self, result: OperationResult) -> None:
+            """Append one streamed result to the results tree (UI thread)."""
+            if result.success:
+                if self._success_node is None:
+                    self._success_node = self._results_tree.root.add(Text(""))
+                    self._success_node.expand()
+                self._success_count += 1
+                self._success_node.set_label(
+                    Text(f"✓ Success ({self._success_count})", style="green")
+                )
+                self._success_node.add_leaf(
+                    Text(f"{result.action}: {result.item.category}/{result.item.name}", style="green")
+                )
+            else:
+                if self._failure_node is None:
+                    self._failure_node = self._results_tree.root.add(Text(""))
+                    self._failure_node.expand()
+                self._failure_count += 1
+                self._failure_node.set_label(
+                    Text(f"✗ Errors ({self._failure_count})", style="red")
+                )
+                self._failure_node.add_leaf(
+                    Text(f"{result.action}: {result.item.category}/{result.item.name} - {result.message}", style="red")
+                )
 
-            # Refresh status after changes
-            for category in self.categories:
-                for item in category.items:
+        def _finish_apply(self, results: list[OperationResult]) -> None:
+            """Reconcile item state and labels once all operations are done."""
+            if not results:
+                self._clear_results()
+
+            # Reconcile only the items we actually touched. Successful
+            # installs and uninstalls have a known new status; only failures
+            # need a real syscall to find out what happened.
+            touched = {id(result.item) for result in results}
+            for result in results:
+                item = result.item
+                category = self.categories_by_name[item.category]
+                was_installed = item.status == ItemStatus.INSTALLED
+                was_selected = item.selected
+                if result.success:
+                    item.status = (
+                        ItemStatus.INSTALLED
+                        if result.action == "install"
+                        else ItemStatus.NOT_INSTALLED
+                    )
+                    item._set_error(None)
+                else:
                     item.check_status()
-                    # Update selection to match new status
-                    item.selected = item.status == ItemStatus.INSTALLED
+                # Update selection to match new status
+                item.selected = item.status == ItemStatus.INSTALLED
+                now_installed = item.status == ItemStatus.INSTALLED
+                category.installed_count += int(now_installed) - int(was_installed)
+                category.selected_count += int(item.selected) - int(was_selected)
+                self._refresh_item_label(item)
+
+            for category in self.categories:
+                if any(id(item) in touched for item in category.items):
+                    self._refresh_category_label(category)
 
-            self._update_tree_display()
-            self.show_results(results)
+            self._applying = False
+            self.query_one("#apply-btn", Button).disabled = False
 
         def _install_item(self, item: Item, dest_dir: Path) -> OperationResult:
             """Install an item by creating a symlink."""
@@ -487,7 +730,11 @@ def run_app():
                 # Ensure destination directory exists
                 dest_dir.mkdir(parents=True, exist_ok=True)
 
-                if item.dest_path.exists() or item.dest_path.is_symlink():
+                # Try first: one symlink syscall in the success case instead
+                # of two pre-flight existence probes.
+                try:
+                    os.symlink(item.source_path, item.dest_str)
+                except FileExistsError:
                     return OperationResult(
                         item=item,
                         action="install",
@@ -495,7 +742,6 @@ def run_app():
                         message=f"Destination already exists: {item.dest_path}",
                     )
 
-                item.dest_path.symlink_to(item.source_path)
                 return OperationResult(
                     item=item,
                     action="install",
@@ -513,7 +759,11 @@ def run_app():
         def _uninstall_item(self, item: Item) -> OperationResult:
             """Uninstall an item by removing the symlink."""
             try:
-                if not item.dest_path.is_symlink():
+                # readlink answers "is it a symlink?" and "where does it
+                # point?" in one syscall; missing or non-symlink paths raise.
+                try:
+                    target = os.readlink(item.dest_str)
+                except OSError:
                     return OperationResult(
                         item=item,
                         action="uninstall",
@@ -521,9 +771,8 @@ def run_app():
                         message=f"Not a symlink: {item.dest_path}",
                     )
 
-                target = item.dest_path.resolve()
-                expected = item.source_path.resolve()
-                if target != expected:
+                expected = item._resolved_source or item.source_path.resolve()
+                if target != str(expected) and not _same_file(item.dest_str, str(expected)):
                     return OperationResult(
                         item=item,
                         action="uninstall",
@@ -531,7 +780,7 @@ def run_app():
                         message=f"Symlink points elsewhere: {target}",
                     )
 
-                item.dest_path.unlink()
+                os.unlink(item.dest_str)
                 return OperationResult(
                     item=item,
                     action="uninstall",
@@ -546,35 +795,11 @@ def run_app():
                     message=str(e),
                 )
 
-        def show_results(self, results: list[OperationResult]) -> None:
-            """Show operation results in the results container."""
+        def _clear_results(self) -> None:
+            """Reset the results container to its no-op message."""
             results_container = self.query_one("#results-container")
             results_container.remove_children()
-
-            if not results:
-                results_container.mount(Static("No operations performed.", classes=""))
-                return
-
-            # Build results tree
-            tree = Tree("Results")
-            tree.root.expand()
-
-            successes = [r for r in results if r.success]
-            failures = [r for r in results if not r.success]
-
-            if successes:
-                success_node = tree.root.add(Text(f"✓ Success ({len(successes)})", style="green"))
-                success_node.expand()
-                for r in successes:
-                    success_node.add_leaf(Text(f"{r.action}: {r.item.category}/{r.item.name}", style="green"))
-
-            if failures:
-                failure_node = tree.root.add(Text(f"✗ Errors ({len(failures)})", style="red"))
-                failure_node.expand()
-                for r in failures:
-                    failure_node.add_leaf(Text(f"{r.action}: {r.item.category}/{r.item.name} - {r.message}", style="red"))
-
-            results_container.mount(tree)
+            results_container.mount(Static("No operations performed."))
 
     # Run the app
     source_dir = SCRIPT_DIR